@@ -6,8 +6,6 @@ import os
 import re
 import sys
 
-import qtawesome as qta
-
 logger = logging.getLogger(__name__)
 
 # Create stderr, set to None on Windows. Required for BaseHTTPRequestHandler to be able to log.
@@ -95,6 +93,8 @@ DEFAULT_INTEGRATIONS_REPO_URL = (
 
 
 def load_icons(font_folder):
+    import qtawesome as qta
+
     font_folder = os.path.abspath(font_folder)
     if not _resource['loaded']:
         logger.info(f'loading ftrack icon fonts from {font_folder}')
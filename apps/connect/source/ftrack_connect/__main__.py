@@ -1,65 +1,56 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2014-2023 ftrack
 
+import atexit
 import sys
-import platformdirs
 import argparse
 import logging
 import signal
 import os
-import importlib
 
-from ftrack_connect.utils.plugin import (
-    create_target_plugin_directory,
-    PLUGIN_DIRECTORIES,
-)
+# Logging levels selectable with --verbosity.
+_LOGGING_LEVELS = {
+    'notset': logging.NOTSET,
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
 
 
-def main_connect(arguments=None):
-    '''Launch ftrack connect.'''
-
-    bindings = ['PySide2']
-    os.environ.setdefault('QT_PREFERRED_BINDING', os.pathsep.join(bindings))
+def _load_qt_stack():
+    '''Import and return the Qt binding as (QtWidgets, QtCore, is_pyside2).
 
+    Kept out of module scope so that trivial invocations such as ``--help``
+    do not pay for loading Qt.
+    '''
     try:
         from PySide6 import QtWidgets, QtCore
 
         is_pyside2 = False
     except ImportError:
+        # Only advertise the legacy binding to Qt.py consumers when we
+        # actually fall back to it.
+        os.environ.setdefault('QT_PREFERRED_BINDING', 'PySide2')
+
         from PySide2 import QtWidgets, QtCore
 
         is_pyside2 = True
 
-    from ftrack_connect import load_fonts_resource
-    import ftrack_connect.utils.log
-    import ftrack_connect.singleton
+    return QtWidgets, QtCore, is_pyside2
 
-    # Bootstrap hooks
-    import ftrack_connect.hook
-
-    import ftrack_connect.ui.application
-    import ftrack_connect.ui.theme
 
+def main_connect(arguments=None):
+    '''Launch ftrack connect.'''
     parser = argparse.ArgumentParser(prog='ftrack-connect')
 
     # Allow setting of logging level from arguments.
-    loggingLevels = {}
-
-    for level in (
-        logging.NOTSET,
-        logging.DEBUG,
-        logging.INFO,
-        logging.WARNING,
-        logging.ERROR,
-        logging.CRITICAL,
-    ):
-        loggingLevels[logging.getLevelName(level).lower()] = level
-
     parser.add_argument(
         '-v',
         '--verbosity',
         help='Set the logging output verbosity.',
-        choices=loggingLevels.keys(),
+        choices=_LOGGING_LEVELS,
         default='warning',
     )
 
@@ -87,19 +78,32 @@ def main_connect(arguments=None):
 
     namespace = parser.parse_args(arguments)
 
+    # Heavy imports are deferred until the arguments have been parsed.
+    import ftrack_connect.utils.log
+    from ftrack_connect.utils.plugin import (
+        create_target_plugin_directory,
+        PLUGIN_DIRECTORIES,
+    )
+
     ftrack_connect.utils.log.configure_logging(
-        'ftrack_connect', level=loggingLevels[namespace.verbosity]
+        'ftrack_connect', level=_LOGGING_LEVELS[namespace.verbosity]
     )
+    logger = logging.getLogger('ftrack_connect')
 
     # Make sure plugin directory is created
     create_target_plugin_directory(PLUGIN_DIRECTORIES[0])
 
+    # Acquire the lockfile before importing Qt so a second instance fails
+    # fast without loading the UI stack.
     single_instance = None
     if not namespace.allow_multiple:
+        import platformdirs
+
+        import ftrack_connect.singleton
+
         lockfile = os.path.join(
             platformdirs.user_data_dir('ftrack-connect', 'ftrack'), 'lock'
         )
-        logger = logging.getLogger('ftrack_connect')
         try:
             single_instance = ftrack_connect.singleton.SingleInstance(
                 '', lockfile
@@ -113,20 +117,29 @@ def main_connect(arguments=None):
             )
             raise SystemExit(1)
 
+        # Make sure the lockfile is not orphaned if startup fails below.
+        atexit.register(single_instance.release)
+
+    QtWidgets, QtCore, is_pyside2 = _load_qt_stack()
+
+    from ftrack_connect import load_fonts_resource
+
+    # Bootstrap hooks
+    import ftrack_connect.hook
+
+    import ftrack_connect.ui.application
+    import ftrack_connect.ui.theme
+
     if is_pyside2:
+        application_attribute = QtCore.Qt.ApplicationAttribute
+        set_attribute = QtCore.QCoreApplication.setAttribute
         # These HighDPI settings are deprecated and enabled by default in PySide6.
-        QtCore.QCoreApplication.setAttribute(
-            QtCore.Qt.AA_EnableHighDpiScaling, True
-        )
-        QtCore.QCoreApplication.setAttribute(
-            QtCore.Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True
-        )
+        set_attribute(application_attribute.AA_EnableHighDpiScaling, True)
+        set_attribute(application_attribute.AA_UseHighDpiPixmaps, True)
         # If under X11, make Xlib calls thread-safe.
         # http://stackoverflow.com/questions/31952711/threading-pyqt-crashes-with-unknown-request-in-queue-while-dequeuing
         if os.name == 'posix':
-            QtCore.QCoreApplication.setAttribute(
-                QtCore.Qt.ApplicationAttribute.AA_X11InitThreads
-            )
+            set_attribute(application_attribute.AA_X11InitThreads, True)
 
     # Construct global application.
 
@@ -137,11 +150,6 @@ def main_connect(arguments=None):
     application.setQuitOnLastWindowClosed(False)
 
     # Handle Ctrl+C (SIGINT) for both Windows and Unix-like systems
-    # Use a timer to allow Python interpreter to run and handle signals
-    timer = QtCore.QTimer()
-    timer.start(500)
-    timer.timeout.connect(lambda: None)
-
     class SignalHandler(QtCore.QObject):
         signal_received = QtCore.Signal()
 
@@ -152,11 +160,37 @@ def main_connect(arguments=None):
         signal.SIGINT, lambda *_: signal_handler.signal_received.emit()
     )
 
+    if os.name == 'posix':
+        # Wake the event loop through a pipe when a signal arrives so the
+        # Python handler gets to run, instead of polling on a timer.
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+
+        def _drain_wakeup_fd():
+            try:
+                while os.read(read_fd, 512):
+                    pass
+            except BlockingIOError:
+                pass
+
+        signal_notifier = QtCore.QSocketNotifier(
+            read_fd, QtCore.QSocketNotifier.Type.Read
+        )
+        signal_notifier.activated.connect(_drain_wakeup_fd)
+    else:
+        # No wakeup fd support for the Qt event loop on Windows, use a timer
+        # to allow Python interpreter to run and handle signals.
+        timer = QtCore.QTimer()
+        timer.start(1000)
+        timer.timeout.connect(lambda: None)
+
     # Construct main connect window and apply theme.
     connectWindow = ftrack_connect.ui.application.Application(
         theme=str(namespace.theme),
         instance=single_instance,
-        log_level=loggingLevels[namespace.verbosity],
+        log_level=_LOGGING_LEVELS[namespace.verbosity],
     )
 
     if namespace.silent:
@@ -168,51 +202,64 @@ def main_connect(arguments=None):
     application.setFont(font)
     application.aboutToQuit.connect(connectWindow.emitConnectUsage)
 
-    load_fonts_resource()
+    # Icon fonts are not needed for the first paint, widgets that use them
+    # load them on discovery, so register them once the event loop runs.
+    QtCore.QTimer.singleShot(0, load_fonts_resource)
 
     return application.exec_()
 
 
+def _sniff_arguments(argv):
+    '''Return (framework_standalone_module, script) sniffed from *argv*.
+
+    Only the first argument is inspected, no other position can trigger
+    these modes. Both values are None when Connect should launch normally.
+    '''
+    if len(argv) >= 3 and argv[1] == '--run-framework-standalone':
+        # (Unofficial feature) Run framework standalone process using Connect Python interpreter
+        return argv[2], None
+    elif len(argv) >= 2 and argv[1].endswith('.py'):
+        # Run a script
+        return None, argv[1]
+    return None, None
+
+
 def main(arguments=None):
     '''Main app entry point.'''
     # Pre-parse arguments to check if we should run a framework standalone process
-    framework_standalone_module = None
-    script = None
-    for index, arg in enumerate(sys.argv):
-        if arg == '--run-framework-standalone':
-            # (Unofficial feature) Run framework standalone process using Connect Python interpreter
-            framework_standalone_module = sys.argv[index + 1]
-            break
-        elif index == 1 and arg.endswith('.py'):
-            # Run a script
-            script = sys.argv[index]
-            break
+    framework_standalone_module, script = _sniff_arguments(sys.argv)
     if framework_standalone_module:
         # Run the framework standalone module using Connect
-
         # Connect installer built executable does not bootstrap PYTHONPATH,
         # make sure it is done properly.
+        existing_paths = set(sys.path)
         dependencies_path = None
-        for path in os.environ.get('PYTHONPATH', []).split(os.pathsep):
-            if path.find('dependencies') > -1:
+        for path in os.environ.get('PYTHONPATH', '').split(os.pathsep):
+            if not path:
+                continue
+            if 'dependencies' in path:
                 dependencies_path = path
-            elif path not in sys.path:
+            elif path not in existing_paths:
                 sys.path.append(path)
+                existing_paths.add(path)
         # Put plugin deps first in sys.path to have priority over Connect packages, does not really
         # work since pyinstaller since its python interpreter deps seems locked to the executable
-        sys.path.insert(0, dependencies_path)
+        if dependencies_path:
+            sys.path.insert(0, dependencies_path)
 
         # Adding dependencies folder on top does not make the imports work as expected,
         # libs (utils & framework core) are still loaded and used from Connect.
         # TODO: Provide a better way to do this, for example by running through a separate
         # clean framework Python interpreter.
 
-        importlib.import_module(framework_standalone_module, package=None)
+        __import__(framework_standalone_module)
     elif script:
         # Ported from Connect 2 installer main
         # If first argument is an executable python script, execute the file.
-        exec(open(script).read())
-        raise SystemExit()
+        import runpy
+
+        runpy.run_path(script, run_name='__main__')
+        raise SystemExit(0)
     else:
         return main_connect(arguments)
 
@@ -45,15 +45,16 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
     apply_changes = QtCore.Signal(object)
     # List of plugins to archive as argument
 
+    # Icons are shared by all instances, see _init_icons.
+    _ICON_CHECK = None
+    _ICON_RESET = None
+    _ICON_DONE = None
+    _ICON_FAILED = None
+
     @property
     def items(self):
         '''Return items in plugin list.'''
-        result = []
-        num_items = self._plugin_list_widget.plugin_model.rowCount()
-        for i in range(num_items):
-            item = self._plugin_list_widget.plugin_model.item(i)
-            result.append(item)
-        return result
+        return list(self._iter_items())
 
     @property
     def installed_plugins(self):
@@ -67,25 +68,52 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         self._label = None
         self._select_release_type_widget = None
         self._search_bar = None
+        self._filter_timer = None
         self._plugin_list_widget = None
         self._button_layout = None
         self._apply_button = None
+        self._apply_button_timer = None
         self._reset_button = None
         self._welcome_dialog = None
         self._blocking_overlay = None
         self._busy_overlay = None
+        self._archive_message_box = None
         self._plugins_to_install = None
+        # Checked plugin items keyed by plugin id, kept in sync on itemChanged
+        # so the model does not have to be walked on every check state change.
+        self._checked_items = {}
         self._counter = 0
         self._initialised = False
         self._installed_plugins = None
+        self._incompatible_plugin_names = []
+        self._deprecated_plugin_names = []
 
         self._reset_plugin_list()
         self._plugin_processor = PluginProcessor()
+        self._init_icons()
 
         self.pre_build()
         self.build()
         self.post_build()
 
+    @classmethod
+    def _init_icons(cls):
+        '''Render the icons used by the plugin manager once per class.
+
+        A QApplication has to exist, hence this is not done at class
+        definition time.
+        '''
+        if cls._ICON_CHECK is not None:
+            return
+        cls._ICON_CHECK = QtGui.QIcon(qta.icon('mdi6.check'))
+        cls._ICON_RESET = QtGui.QIcon(qta.icon('mdi6.lock-reset'))
+        cls._ICON_DONE = qta.icon(
+            'mdi6.check', color='#FFDD86', scale_factor=1.2
+        )
+        cls._ICON_FAILED = qta.icon(
+            'mdi6.close', color='#FF8686', scale_factor=1.2
+        )
+
     def pre_build(self):
         layout = QtWidgets.QVBoxLayout()
         self.setLayout(layout)
@@ -94,6 +122,11 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         self._search_bar = QtWidgets.QLineEdit()
         self._search_bar.setPlaceholderText('Search plugin...')
 
+        # Coalesce typing bursts into a single refilter of the plugin list.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+
         self.layout().addWidget(self._search_bar)
         self._label = QtWidgets.QLabel(
             'Check the plugins you want to install or add your'
@@ -116,11 +149,17 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         self._button_layout = QtWidgets.QHBoxLayout()
 
         self._apply_button = QtWidgets.QPushButton('Install Plugins')
-        self._apply_button.setIcon(QtGui.QIcon(qta.icon('mdi6.check')))
+        self._apply_button.setIcon(self._ICON_CHECK)
         self._apply_button.setDisabled(True)
 
+        # Coalesce bursts of check state changes into a single apply button
+        # update.
+        self._apply_button_timer = QtCore.QTimer(self)
+        self._apply_button_timer.setSingleShot(True)
+        self._apply_button_timer.setInterval(0)
+
         self._reset_button = QtWidgets.QPushButton('Clear selection')
-        self._reset_button.setIcon(QtGui.QIcon(qta.icon('mdi6.lock-reset')))
+        self._reset_button.setIcon(self._ICON_RESET)
         self._reset_button.setMaximumWidth(120)
 
         self._button_layout.addWidget(self._apply_button)
@@ -128,16 +167,8 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
 
         self.layout().addLayout(self._button_layout)
 
-        self._welcome_dialog = WelcomeDialog(
-            self._on_install_all_callback, self._on_restart_callback
-        )
-        self._welcome_dialog.hide()
-        self.layout().addWidget(self._welcome_dialog)
-
-        # overlays
-        self._blocking_overlay = InstallerBlockingOverlay(self)
-        self._blocking_overlay.hide()
-
+        # The welcome dialog and blocking overlay are only needed on first
+        # run and after installing, they are created on first use.
         self._busy_overlay = BusyOverlay(self, 'Updating....')
         self._busy_overlay.hide()
 
@@ -148,9 +179,8 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         )
         self._apply_button.clicked.connect(self._on_apply_changes)
         self._reset_button.clicked.connect(self.refresh)
-        self._search_bar.textChanged.connect(
-            self._plugin_list_widget.proxy_model.setFilterFixedString
-        )
+        self._search_bar.textChanged.connect(self._filter_timer.start)
+        self._filter_timer.timeout.connect(self._apply_filter)
         self.show_welcome.connect(self._on_show_welcome_callback)
         self.apply_changes.connect(self.on_apply_changes_confirmed_callback)
         self.installation_started.connect(self._busy_overlay.show)
@@ -166,12 +196,41 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         self.refresh_done.connect(self._busy_overlay.hide)
 
         self._plugin_list_widget.plugin_model.itemChanged.connect(
-            self._enable_apply_button
+            self._on_plugin_item_changed
+        )
+        self._apply_button_timer.timeout.connect(self._update_apply_button)
+        self._plugin_list_widget.plugin_model.modelReset.connect(
+            self._checked_items.clear
+        )
+        self._plugin_list_widget.plugin_model.rowsAboutToBeRemoved.connect(
+            self._on_plugin_rows_removed
         )
 
-        self._blocking_overlay.confirm_button.clicked.connect(self.refresh)
-        self._blocking_overlay.restart_button.clicked.connect(
-            self._on_restart_callback
+    def _get_welcome_dialog(self):
+        '''Return the welcome dialog, creating it on first use.'''
+        if self._welcome_dialog is None:
+            self._welcome_dialog = WelcomeDialog(
+                self._on_install_all_callback, self._on_restart_callback
+            )
+            self._welcome_dialog.hide()
+            self.layout().addWidget(self._welcome_dialog)
+        return self._welcome_dialog
+
+    def _get_blocking_overlay(self):
+        '''Return the blocking overlay, creating it on first use.'''
+        if self._blocking_overlay is None:
+            self._blocking_overlay = InstallerBlockingOverlay(self)
+            self._blocking_overlay.hide()
+            self._blocking_overlay.confirm_button.clicked.connect(self.refresh)
+            self._blocking_overlay.restart_button.clicked.connect(
+                self._on_restart_callback
+            )
+        return self._blocking_overlay
+
+    def _apply_filter(self):
+        '''Filter the plugin list on the search bar text.'''
+        self._plugin_list_widget.proxy_model.setFilterFixedString(
+            self._search_bar.text()
         )
 
     def _on_restart_callback(self):
@@ -183,11 +242,12 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
 
     def _emit_downloaded_plugins(self, plugins):
         metadata = {'installed_plugins': []}
+        _os = platform.platform()
 
         for plugin in plugins:
-            name = str(plugin.data(ROLES.PLUGIN_NAME))
+            # Plugin name is stored as a string, version as a parsed Version.
+            name = plugin.data(ROLES.PLUGIN_NAME)
             version = str(plugin.data(ROLES.PLUGIN_VERSION))
-            _os = str(platform.platform())
 
             plugin_data = {'name': name, 'version': version, 'os': _os}
             metadata['installed_plugins'].append(plugin_data)
@@ -196,17 +256,38 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         if usage_tracker:
             usage_tracker.track("INSTALLED-CONNECT-PLUGINS", metadata)
 
+    def _on_plugin_rows_removed(self, parent, first, last):
+        '''Drop removed rows *first* to *last* from the checked items.'''
+        plugin_model = self._plugin_list_widget.plugin_model
+        for row in range(first, last + 1):
+            self._checked_items.pop(
+                plugin_model.item(row).data(ROLES.PLUGIN_ID), None
+            )
+
     @qt_main_thread
     def _enable_apply_button(self, item):
-        '''Check the plugins state.'''
+        '''Check the plugins state, updating the checked items from the
+        changed *item* or from the whole model if *item* is None.'''
+        if item is None:
+            self._checked_items.clear()
+            for model_item in self._iter_items():
+                self._update_checked_item(model_item)
+        else:
+            self._update_checked_item(item)
+        self._update_apply_button()
+
+    def _on_plugin_item_changed(self, item):
+        '''Track the check state of *item* and schedule an apply button
+        update.'''
+        self._update_checked_item(item)
+        self._apply_button_timer.start()
+
+    def _update_apply_button(self):
+        '''Update the apply button from the checked items.'''
+        self._apply_button_timer.stop()
         self._apply_button.setDisabled(True)
-        items = []
-        for index in range(self._plugin_list_widget.plugin_model.rowCount()):
-            if (
-                self._plugin_list_widget.plugin_model.item(index).checkState()
-                == QtCore.Qt.CheckState.Checked
-            ):
-                items.append(self._plugin_list_widget.plugin_model.item(index))
+
+        items = self._get_checked_items()
 
         self._plugins_to_install = items
 
@@ -217,6 +298,25 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
             f'Install {len(self._plugins_to_install)} Plugins'
         )
 
+    def _iter_items(self):
+        '''Yield items in plugin list.'''
+        plugin_model = self._plugin_list_widget.plugin_model
+        for i in range(plugin_model.rowCount()):
+            yield plugin_model.item(i)
+
+    def _get_checked_items(self):
+        '''Return checked plugin items in model order.'''
+        return sorted(
+            self._checked_items.values(), key=lambda item: item.row()
+        )
+
+    def _update_checked_item(self, item):
+        '''Add or remove *item* from the checked items.'''
+        if item.checkState() == QtCore.Qt.CheckState.Checked:
+            self._checked_items[item.data(ROLES.PLUGIN_ID)] = item
+        else:
+            self._checked_items.pop(item.data(ROLES.PLUGIN_ID), None)
+
     @asynchronous
     def refresh(self):
         '''Force refresh of the model, fetching all the available plugins. This
@@ -232,6 +332,13 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
     def _on_plugin_fetch_callback(self, plugins):
         '''Callback on fetching installed plugins from Connect'''
         self._installed_plugins = plugins
+        self._incompatible_plugin_names = []
+        self._deprecated_plugin_names = []
+        for plugin in plugins:
+            if plugin['incompatible']:
+                self._incompatible_plugin_names.append(plugin['name'])
+            if plugin['deprecated']:
+                self._deprecated_plugin_names.append(plugin['name'])
         self._plugin_list_widget.populate_installed_plugins(plugins)
         self._plugin_list_widget.populate_download_plugins(
             self._select_release_type_widget.isChecked()
@@ -260,29 +367,37 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
             )
             return
 
-        self._label.setVisible(False)
-        self._search_bar.setVisible(False)
-        self._plugin_list_widget.setVisible(False)
-        self._reset_button.setVisible(False)
-        self._apply_button.setVisible(False)
-        self._welcome_dialog.set_downloadable_plugin_count(
-            downloadable_plugin_count
-        )
-        self._welcome_dialog.exec_()
-        self._welcome_dialog.hide()
-        self._label.setVisible(True)
-        self._search_bar.setVisible(True)
-        self._plugin_list_widget.setVisible(True)
-        self._reset_button.setVisible(True)
-        self._apply_button.setVisible(True)
+        self._set_plugin_list_visible(False)
+        welcome_dialog = self._get_welcome_dialog()
+        welcome_dialog.set_downloadable_plugin_count(downloadable_plugin_count)
+        welcome_dialog.exec_()
+        welcome_dialog.hide()
+        self._set_plugin_list_visible(True)
+
+    def _set_plugin_list_visible(self, visible):
+        '''Show or hide the plugin list and its controls based on
+        *visible*.'''
+        for widget in (
+            self._label,
+            self._search_bar,
+            self._plugin_list_widget,
+            self._reset_button,
+            self._apply_button,
+        ):
+            widget.setVisible(visible)
 
     def _on_install_all_callback(self, on_plugin_installed_callback):
         '''Install all downloadable plugins, to be called from welcome dialog'''
-        num_items = self._plugin_list_widget.plugin_model.rowCount()
-        for i in range(num_items):
-            item = self._plugin_list_widget.plugin_model.item(i)
-            self._plugin_processor.process(item)
-            on_plugin_installed_callback(i + 1)
+        items = list(self._iter_items())
+
+        def on_progress(index, item):
+            # Report plugins installed so far, the last one is reported below.
+            if index:
+                on_plugin_installed_callback(index)
+
+        self._plugin_processor.process_batch(items, on_progress)
+        if items:
+            on_plugin_installed_callback(len(items))
         self._reset_plugin_list()
 
     def _on_select_release_type_callback(self):
@@ -290,22 +405,20 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
 
     def _show_user_message_done(self):
         '''Show final message to the user.'''
-        self._blocking_overlay.message = '<h2>Installation finished!</h2>'
-        self._blocking_overlay.icon_data = qta.icon(
-            'mdi6.check', color='#FFDD86', scale_factor=1.2
-        )
-        self._blocking_overlay.confirm_button.show()
-        self._blocking_overlay.show()
+        blocking_overlay = self._get_blocking_overlay()
+        blocking_overlay.message = '<h2>Installation finished!</h2>'
+        blocking_overlay.icon_data = self._ICON_DONE
+        blocking_overlay.confirm_button.show()
+        blocking_overlay.show()
 
     def _show_user_message_failed(self, reason):
         '''Show final message to the user.'''
-        self._blocking_overlay.message = '<h2>Installation FAILED!</h2>'
-        self._blocking_overlay.icon_data = qta.icon(
-            'mdi6.close', color='#FF8686', scale_factor=1.2
-        )
-        self._blocking_overlay.set_reason(reason)
-        self._blocking_overlay.confirm_button.show()
-        self._blocking_overlay.show()
+        blocking_overlay = self._get_blocking_overlay()
+        blocking_overlay.message = '<h2>Installation FAILED!</h2>'
+        blocking_overlay.icon_data = self._ICON_FAILED
+        blocking_overlay.set_reason(reason)
+        blocking_overlay.confirm_button.show()
+        blocking_overlay.show()
 
     def _reset_overlay(self):
         self._reset_plugin_list()
@@ -321,37 +434,38 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         )
 
     def _get_incompatible_plugin_names(self):
-        result = []
-        for plugin in self.installed_plugins:
-            if plugin['incompatible']:
-                result.append(plugin['name'])
-        return result
+        return list(self._incompatible_plugin_names)
 
     def _get_deprecated_plugin_names(self):
-        result = []
-        for plugin in self.installed_plugins:
-            if plugin['deprecated']:
-                result.append(plugin['name'])
-        return result
+        return list(self._deprecated_plugin_names)
+
+    def _ask_archive_plugins(self, text):
+        '''Ask the user whether to archive plugins described by *text*,
+        return the button answered.'''
+        if self._archive_message_box is None:
+            self._archive_message_box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Icon.Warning,
+                'Warning',
+                '',
+                buttons=QtWidgets.QMessageBox.StandardButton.Yes
+                | QtWidgets.QMessageBox.StandardButton.No
+                | QtWidgets.QMessageBox.StandardButton.Cancel,
+                parent=self,
+            )
+        self._archive_message_box.setText(text)
+        return self._archive_message_box.exec_()
 
     def _on_apply_changes(self):
         '''User wants to apply the updates, warn about conflicting plugins.'''
         incompatible_plugin_names = self._get_incompatible_plugin_names()
         deprecated_plugins = self._get_deprecated_plugin_names()
         if incompatible_plugin_names:
-            msgbox = QtWidgets.QMessageBox(
-                QtWidgets.QMessageBox.Icon.Warning,
-                'Warning',
+            answer = self._ask_archive_plugins(
                 'The following conflicting and incompatible plugins are installed and will be ignored by Connect'
                 ':\n\n{}\n\nClean up and archive them?\n\n Note: you might want to keep them if you are still using Connect 2'.format(
                     '\n'.join(incompatible_plugin_names)
-                ),
-                buttons=QtWidgets.QMessageBox.StandardButton.Yes
-                | QtWidgets.QMessageBox.StandardButton.No
-                | QtWidgets.QMessageBox.StandardButton.Cancel,
-                parent=self,
+                )
             )
-            answer = msgbox.exec_()
             if answer == QtWidgets.QMessageBox.StandardButton.Yes:
                 pass
             elif answer == QtWidgets.QMessageBox.StandardButton.No:
@@ -359,20 +473,13 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
             elif answer == QtWidgets.QMessageBox.StandardButton.Cancel:
                 return
         if deprecated_plugins:
-            msgbox = QtWidgets.QMessageBox(
-                QtWidgets.QMessageBox.Icon.Warning,
-                'Warning',
+            answer = self._ask_archive_plugins(
                 'The following deprecated plugins are installed'
                 ':\n\n{}\n\nClean up and archive them?\n\nNote: they might still function, please '
                 'check release notes for further details. You might want to keep them if you are still using Connect 2'.format(
                     '\n'.join(deprecated_plugins)
-                ),
-                buttons=QtWidgets.QMessageBox.StandardButton.Yes
-                | QtWidgets.QMessageBox.StandardButton.No
-                | QtWidgets.QMessageBox.StandardButton.Cancel,
-                parent=self,
+                )
             )
-            answer = msgbox.exec_()
             if answer == QtWidgets.QMessageBox.StandardButton.Yes:
                 pass
             elif answer == QtWidgets.QMessageBox.StandardButton.No:
@@ -389,12 +496,10 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
         try:
             for plugin in archive_plugins:
                 self._plugin_list_widget.archive_legacy_plugin(plugin)
-            num_items = self._plugin_list_widget.plugin_model.rowCount()
-            for i in range(num_items):
-                item = self._plugin_list_widget.plugin_model.item(i)
-                if item.checkState() == QtCore.Qt.CheckState.Checked:
-                    self.installation_in_progress.emit(item)
-                    self._plugin_processor.process(item)
+            self._plugin_processor.process_batch(
+                self._get_checked_items(),
+                lambda index, item: self.installation_in_progress.emit(item),
+            )
             self.installation_done.emit()
             self._emit_downloaded_plugins(self._plugins_to_install)
             self._reset_plugin_list()
@@ -405,7 +510,7 @@ class PluginManager(ftrack_connect.ui.application.ConnectWidget):
     def get_debug_information(self):
         '''Append all identified plugins as debug information.'''
         result = super(PluginManager, self).get_debug_information()
-        result['installed_plugins'] = []
-        for item in self.items:
-            result['installed_plugins'].append(item.text())
+        result['installed_plugins'] = [
+            item.text() for item in self._iter_items()
+        ]
         return result
@@ -3,7 +3,6 @@
 import re
 import os
 import platformdirs
-from packaging.version import parse as parse_version
 from urllib.request import urlopen
 import json
 import shutil
@@ -23,6 +22,7 @@ from ftrack_connect.utils.plugin import (
     fetch_github_releases,
     get_plugin_data,
     get_platform_identifier,
+    parse_version,
 )
 from ftrack_connect.utils.thread import qt_main_thread
 
@@ -35,6 +35,15 @@ from ftrack_connect.plugin_manager.processor import (
 
 logger = logging.getLogger(__name__)
 
+# Statuses of plugins that can be installed from a source path.
+INSTALLABLE_STATUSES = frozenset((STATUSES.NEW, STATUSES.DOWNLOAD))
+
+# Statuses of listed plugins that can be updated by an installable one.
+UPDATABLE_STATUSES = frozenset((STATUSES.INSTALLED, STATUSES.DOWNLOAD))
+
+# Values of FTRACK_CONNECT_GITHUB_RELEASES_URL disabling the release fetch.
+DISABLED_RELEASES_URL_VALUES = frozenset(('none', 'disable', '0', 'false'))
+
 
 class DndPluginList(QtWidgets.QFrame):
     '''Plugin list widget'''
@@ -71,9 +80,12 @@ class DndPluginList(QtWidgets.QFrame):
         self._installed_plugins = []
         self._plugin_list = None
         self._plugin_model = None
+        # Plugin items in the model keyed by plugin id.
+        self._items_by_id = {}
         self._proxy_model = None
         self._installed_plugin_count = 0
         self._downloadable_plugin_count = 0
+        self._platform_message_box = None
 
         self.setAcceptDrops(True)
 
@@ -91,6 +103,12 @@ class DndPluginList(QtWidgets.QFrame):
         self._plugin_model = QtGui.QStandardItemModel(self)
         self._proxy_model = QtCore.QSortFilterProxyModel(self)
         self._proxy_model.setSourceModel(self._plugin_model)
+        # Match the search against the plugin name only, rather than the
+        # decorated display text.
+        self._proxy_model.setFilterRole(ROLES.PLUGIN_NAME)
+        self._proxy_model.setFilterCaseSensitivity(
+            QtCore.Qt.CaseSensitivity.CaseInsensitive
+        )
         self._plugin_list.setModel(self._proxy_model)
         self.layout().addWidget(self._plugin_list)
 
@@ -98,6 +116,25 @@ class DndPluginList(QtWidgets.QFrame):
         pass
 
     # custom methods
+    def _ask_install_other_platform(self, plugin_name):
+        '''Ask the user whether to install *plugin_name* built for another
+        platform, return the button answered.'''
+        if self._platform_message_box is None:
+            self._platform_message_box = QtWidgets.QMessageBox(
+                QtWidgets.QMessageBox.Icon.Warning,
+                'Warning',
+                '',
+                buttons=QtWidgets.QMessageBox.StandardButton.Yes
+                | QtWidgets.QMessageBox.StandardButton.No
+                | QtWidgets.QMessageBox.StandardButton.Cancel,
+                parent=self,
+            )
+        self._platform_message_box.setText(
+            'This plugin is not compatible with your platform:'
+            f':\n\n{plugin_name}\n\nProceed install anyway?'
+        )
+        return self._platform_message_box.exec_()
+
     @qt_main_thread
     def _add_plugin(self, plugin_data, status=STATUSES.NEW):
         '''Add provided *plugin_data* as plugin with given *status*.'''
@@ -113,17 +150,7 @@ class DndPluginList(QtWidgets.QFrame):
         if plugin_data['platform'] != 'noarch':
             if plugin_data['platform'] != platform:
                 # Not our platform, ask user if they want to install anyway
-                msgbox = QtWidgets.QMessageBox(
-                    QtWidgets.QMessageBox.Icon.Warning,
-                    'Warning',
-                    'This plugin is not compatible with your platform:'
-                    f':\n\n{destination_filename}\n\nProceed install anyway?',
-                    buttons=QtWidgets.QMessageBox.StandardButton.Yes
-                    | QtWidgets.QMessageBox.StandardButton.No
-                    | QtWidgets.QMessageBox.StandardButton.Cancel,
-                    parent=self,
-                )
-                answer = msgbox.exec_()
+                answer = self._ask_install_other_platform(destination_filename)
                 if answer == QtWidgets.QMessageBox.StandardButton.Yes:
                     pass
                 elif answer == QtWidgets.QMessageBox.StandardButton.No:
@@ -183,7 +210,7 @@ class DndPluginList(QtWidgets.QFrame):
                 plugin_item.setEnabled(False)
                 plugin_item.setCheckable(False)
 
-            elif status in [STATUSES.NEW, STATUSES.DOWNLOAD]:
+            elif status in INSTALLABLE_STATUSES:
                 plugin_item.setData(
                     plugin_data['path'], ROLES.PLUGIN_SOURCE_PATH
                 )
@@ -194,21 +221,22 @@ class DndPluginList(QtWidgets.QFrame):
                     destination_path, ROLES.PLUGIN_DESTINATION_PATH
                 )
 
-                if status is STATUSES.NEW:
+                if status == STATUSES.NEW:
                     # enable it by default as is new.
                     plugin_item.setCheckable(True)
                     plugin_item.setCheckState(QtCore.Qt.CheckState.Checked)
 
             self._plugin_model.appendRow(plugin_item)
+            self._items_by_id[plugin_id] = plugin_item
             self._plugin_model.itemChanged.emit(plugin_item)
             return
 
         # update/remove plugin
         stored_status = stored_item.data(ROLES.PLUGIN_STATUS)
-        if stored_status in [
-            STATUSES.INSTALLED,
-            STATUSES.DOWNLOAD,
-        ] and status in [STATUSES.NEW, STATUSES.DOWNLOAD]:
+        if (
+            stored_status in UPDATABLE_STATUSES
+            and status in INSTALLABLE_STATUSES
+        ):
             stored_plugin_version = stored_item.data(ROLES.PLUGIN_VERSION)
             should_update = stored_plugin_version < new_plugin_version
             if not should_update:
@@ -235,31 +263,25 @@ class DndPluginList(QtWidgets.QFrame):
 
     def plugin_is_available(self, plugin_data):
         '''Return item from *plugin_data* if found.'''
-        num_items = self._plugin_model.rowCount()
-        for i in range(num_items):
-            item = self._plugin_model.item(i)
-            item_id = item.data(ROLES.PLUGIN_ID)
-            if item_id == plugin_data['id']:
-                return item
-        return None
+        return self._items_by_id.get(plugin_data['id'])
 
     def _remove_plugin(self, plugin_name):
         '''Remove the plugin *plugin_name* from plugin list (not disk),
         if succeeded/found True will be returned, False otherwise.'''
-        num_items = self._plugin_model.rowCount()
-        for i in range(num_items):
-            item = self._plugin_model.item(i)
-            item_name = item.data(ROLES.PLUGIN_NAME)
-            if item_name == plugin_name:
-                # Remove item
-                self._plugin_model.takeRow(i)
-                return True
-        return False
+        plugin_id = str(hash(plugin_name))
+        item = self._items_by_id.get(plugin_id)
+        if item is None or item.data(ROLES.PLUGIN_NAME) != plugin_name:
+            return False
+        # Remove item
+        self._plugin_model.takeRow(item.row())
+        del self._items_by_id[plugin_id]
+        return True
 
     def populate_installed_plugins(self, plugins):
         '''Populate model with installed plugins.'''
         self._installed_plugin_count = 0
         self._plugin_model.clear()
+        self._items_by_id.clear()
 
         self._installed_plugins = []
 
@@ -275,7 +297,7 @@ class DndPluginList(QtWidgets.QFrame):
                     'Warning',
                     f'The following plugin failed to load:\n\n{plugin}\n\n{e}',
                 )
-                logger.warning(f'Failed to add plugin {plugin}: ')
+                logger.warning('Failed to add plugin %s: ', plugin)
 
     def populate_download_plugins(self, prereleases=False):
         '''Populate model with remotely configured plugins.'''
@@ -295,7 +317,7 @@ class DndPluginList(QtWidgets.QFrame):
                 'FTRACK_CONNECT_GITHUB_RELEASES_URL',
                 DEFAULT_INTEGRATIONS_REPO_URL,
             )
-            if url.lower() in ['none', 'disable', '0', 'false']:
+            if url.lower() in DISABLED_RELEASES_URL_VALUES:
                 logger.warning(
                     'Not attempting to fetch releases from Github, '
                     'disabled by environment variable.'
@@ -315,7 +337,7 @@ class DndPluginList(QtWidgets.QFrame):
         install_path = os.path.join(
             self.default_install_plugin_directory, plugin_name
         )
-        logger.debug(f'Archiving legacy plugin: {install_path}')
+        logger.debug('Archiving legacy plugin: %s', install_path)
         if os.path.exists(install_path) and os.path.isdir(install_path):
             archive_base_path = os.path.relpath(
                 os.path.join(
@@ -333,29 +355,33 @@ class DndPluginList(QtWidgets.QFrame):
                 # Move it to archive
                 try:
                     logger.warning(
-                        f'Attempting to archive plugin: {install_path} > {archive_path}'
+                        'Attempting to archive plugin: %s > %s',
+                        install_path,
+                        archive_path,
                     )
                     shutil.move(install_path, archive_path)
-                    logger.warning(f'Archived plugin: {install_path}')
+                    logger.warning('Archived plugin: %s', install_path)
                     remove = False
                 except Exception as e:
                     logger.exception(e)
                     logger.error(
-                        f'Plugin archive failed, please check permissions! {e}'
+                        'Plugin archive failed, please check permissions! %s',
+                        e,
                     )
             else:
-                logger.warning(f'Plugin is already archived @ {archive_path}')
+                logger.warning('Plugin is already archived @ %s', archive_path)
             if remove:
-                logger.warning(f'Attempting to remove plugin: {install_path}')
+                logger.warning('Attempting to remove plugin: %s', install_path)
                 try:
                     shutil.rmtree(
                         install_path, ignore_errors=False, onerror=None
                     )
-                    logger.warning(f'Removed plugin: {install_path}')
+                    logger.warning('Removed plugin: %s', install_path)
                 except Exception as e:
                     logger.exception(e)
                     logger.error(
-                        f'Plugin removal failed, please check permissions! {e}'
+                        'Plugin removal failed, please check permissions! %s',
+                        e,
                     )
 
     def _process_mime_data(self, mime_data):
@@ -9,6 +9,7 @@ import qtawesome as qta
 import urllib
 import traceback
 import zipfile
+import concurrent.futures
 from urllib.error import HTTPError
 
 try:
@@ -19,6 +20,9 @@ from ftrack_connect.utils.plugin import get_platform_identifier
 
 logger = logging.getLogger(__name__)
 
+# Size of the blocks plugin archives are downloaded in.
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
 
 class STATUSES(object):
     '''Store plugin statuses'''
@@ -53,6 +57,25 @@ STATUS_ICONS = {
 }
 
 
+class _PluginData(object):
+    '''Plain copy of the *plugin* item data needed to process it.'''
+
+    _ROLES = (
+        ROLES.PLUGIN_STATUS,
+        ROLES.PLUGIN_NAME,
+        ROLES.PLUGIN_SOURCE_PATH,
+        ROLES.PLUGIN_INSTALLED_PATH,
+        ROLES.PLUGIN_DESTINATION_PATH,
+    )
+
+    def __init__(self, plugin):
+        self._data = {role: plugin.data(role) for role in self._ROLES}
+
+    def data(self, role):
+        '''Return the value stored for *role*.'''
+        return self._data.get(role)
+
+
 class PluginProcessor(QtCore.QObject):
     '''Handles installation process of plugins.'''
 
@@ -80,19 +103,50 @@ class PluginProcessor(QtCore.QObject):
         ]:
             try:
                 zip_name = os.path.basename(source_path_noarch)
-                save_path = tempfile.gettempdir()
-                temp_path = os.path.join(save_path, zip_name)
-
-                logger.info(f'Downloading {source_path} to {temp_path}')
 
                 with urllib.request.urlopen(source_path) as dl_file:
-                    with open(temp_path, 'wb') as out_file:
-                        out_file.write(dl_file.read())
+                    # A unique file per download, written through the
+                    # returned descriptor, so that concurrent downloads of
+                    # the same archive never share a path.
+                    fd, temp_path = tempfile.mkstemp(suffix=f'-{zip_name}')
+                    logger.info('Downloading %s to %s', source_path, temp_path)
+                    try:
+                        with os.fdopen(fd, 'wb') as out_file:
+                            # Stream the archive rather than holding all of
+                            # it in memory, reading into one reused buffer.
+                            if dl_file.length and hasattr(
+                                os, 'posix_fallocate'
+                            ):
+                                # Reserve the whole archive up front rather
+                                # than growing the file block by block.
+                                try:
+                                    os.posix_fallocate(
+                                        out_file.fileno(), 0, dl_file.length
+                                    )
+                                except OSError:
+                                    # Not supported by every filesystem, the
+                                    # file then grows as it is written.
+                                    pass
+                            buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+                            view = memoryview(buffer)
+                            while True:
+                                size = dl_file.readinto(buffer)
+                                if not size:
+                                    break
+                                out_file.write(view[:size])
+                            # Drop any reserved space left by a short read.
+                            out_file.truncate()
+                    except Exception:
+                        # Do not leave a partial archive behind.
+                        os.remove(temp_path)
+                        raise
                 return temp_path
             except HTTPError as e:
                 if platform_dependent:
                     logger.debug(
-                        f'No download exists {source_path} on platform {platform}'
+                        'No download exists %s on platform %s',
+                        source_path,
+                        platform,
                     )
                 else:
                     logger.warning(traceback.format_exc())
@@ -112,6 +166,38 @@ class PluginProcessor(QtCore.QObject):
 
         plugin_fn(plugin)
 
+    def process_batch(self, plugins, progress_callback=None, max_workers=4):
+        '''Process provided *plugins* items, *max_workers* at a time.
+
+        Each plugin is downloaded and extracted to its own paths, so plugins
+        are processed in parallel. The item data is read on the calling
+        thread, the workers only get plain copies of it as the model is not
+        thread safe. *progress_callback* is called from the calling thread
+        with the number of plugins started so far and the plugin item about
+        to be processed. The first failure is raised once the plugins being
+        processed are done, remaining plugins are skipped.
+        '''
+        plugins = [(plugin, _PluginData(plugin)) for plugin in plugins]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor:
+            running = set()
+            for index, (plugin, plugin_data) in enumerate(plugins):
+                if len(running) >= max_workers:
+                    # Only submit once a worker is free, so that the progress
+                    # is reported as the plugin is about to be processed.
+                    done, running = concurrent.futures.wait(
+                        running,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        future.result()
+                if progress_callback:
+                    progress_callback(index, plugin)
+                running.add(executor.submit(self.process, plugin_data))
+            for future in concurrent.futures.as_completed(running):
+                future.result()
+
     def update(self, plugin):
         '''Update provided *plugin* item.'''
         self.remove(plugin)
@@ -120,11 +206,22 @@ class PluginProcessor(QtCore.QObject):
     def install(self, plugin):
         '''Install provided *plugin* item.'''
         source_path = plugin.data(ROLES.PLUGIN_SOURCE_PATH)
-        if source_path.startswith('http'):
+        downloaded = source_path.startswith('http')
+        if downloaded:
             source_path = self.download(plugin)
 
+        try:
+            self._extract(source_path, plugin)
+        finally:
+            if downloaded:
+                # Each download has its own temporary file, remove it once
+                # extracted.
+                os.remove(source_path)
+
+    def _extract(self, source_path, plugin):
+        '''Extract *source_path* archive of provided *plugin* item.'''
         destination_path = plugin.data(ROLES.PLUGIN_DESTINATION_PATH)
-        logger.debug(f'Installing {source_path} to {destination_path}')
+        logger.debug('Installing %s to %s', source_path, destination_path)
 
         with zipfile.ZipFile(source_path, 'r') as zip_ref:
             name_list = zip_ref.namelist()
@@ -151,7 +248,7 @@ class PluginProcessor(QtCore.QObject):
     def remove(self, plugin):
         '''Remove provided *plugin* item.'''
         install_path = plugin.data(ROLES.PLUGIN_INSTALLED_PATH)
-        logger.debug(f'Removing {install_path}')
+        logger.debug('Removing %s', install_path)
         if (
             install_path
             and os.path.exists(install_path)
@@ -159,4 +256,4 @@ class PluginProcessor(QtCore.QObject):
         ):
             shutil.rmtree(install_path, ignore_errors=False, onerror=None)
         else:
-            logger.warning(f'Could not remove {install_path} - not found!')
+            logger.warning('Could not remove %s - not found!', install_path)
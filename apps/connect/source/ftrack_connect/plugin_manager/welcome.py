@@ -21,6 +21,9 @@ class WelcomeDialog(QtWidgets.QDialog):
 
     plugins_installed = QtCore.Signal()
     installing = QtCore.Signal()
+    install_progress = QtCore.Signal(object)
+    # Number of plugins installed so far as argument
+
     # local variables for finding and installing plugin manager.
     install_path = platformdirs.user_data_dir(
         'ftrack-connect-plugins', 'ftrack'
@@ -140,6 +143,7 @@ class WelcomeDialog(QtWidgets.QDialog):
         self._skip.clicked.connect(self._on_skip_callback)
         self.plugins_installed.connect(self._on_plugins_installed)
         self.installing.connect(self._on_plugins_installing)
+        self.install_progress.connect(self._on_install_progress)
         self._restart_button.clicked.connect(self._on_restart_callback)
 
         self._overlay = ftrack_connect.ui.widget.overlay.BusyOverlay(
@@ -161,19 +165,9 @@ class WelcomeDialog(QtWidgets.QDialog):
         '''Install all available plugins by calling the plugin manager'''
         self._skipped = False
         self.installing.emit()
-        self._overlay.message = (
-            f"Discovered {self._downloadable_plugin_count} plugins."
-        )
-        self._overlay.message = (
-            f"Installed 0/{self._downloadable_plugin_count} plugins."
-        )
-
-        def plugin_installed_callback(index):
-            self._overlay.message = (
-                f"Installed {index}/{self._downloadable_plugin_count} plugins."
-            )
-
-        self._install_all_callback(plugin_installed_callback)
+        # Progress is reported through a signal, so that the overlay is only
+        # updated from the Qt main thread.
+        self._install_all_callback(self.install_progress.emit)
         self.plugins_installed.emit()
 
     def _on_skip_callback(self):
@@ -187,4 +181,12 @@ class WelcomeDialog(QtWidgets.QDialog):
         self._overlay.hide()
 
     def _on_plugins_installing(self):
+        self._overlay.message = (
+            f"Installed 0/{self._downloadable_plugin_count} plugins."
+        )
         self._overlay.show()
+
+    def _on_install_progress(self, count):
+        self._overlay.message = (
+            f"Installed {count}/{self._downloadable_plugin_count} plugins."
+        )
@@ -5,10 +5,11 @@
 import logging
 import os
 import sys
-import tempfile
 
 
-if sys.platform != 'win32':
+if sys.platform == 'win32':
+    import msvcrt
+else:
     import fcntl
 
 logger = logging.getLogger('ftrack_connect.singleton')
@@ -45,6 +46,8 @@ class SingleInstance(object):
         if lockfile:
             self.lockfile = lockfile
         else:
+            import tempfile
+
             basename = '{0}-{1}.lock'.format(
                 os.path.splitext(os.path.abspath(sys.argv[0]))[0]
                 .replace('/', '-')
@@ -57,46 +60,49 @@ class SingleInstance(object):
             )
 
         logger.debug('SingleInstance lockfile: {}'.format(self.lockfile))
+        # A single non-blocking attempt, fail immediately when the lock is
+        # held rather than waiting on it.
         if sys.platform == 'win32':
+            self.fd = os.open(self.lockfile, os.O_CREAT | os.O_RDWR)
             try:
-                # file already exists, we try to remove (in case
-                # previous execution was interrupted)
-                if os.path.exists(self.lockfile):
-                    os.unlink(self.lockfile)
-                self.fd = os.open(
-                    self.lockfile, os.O_CREAT | os.O_EXCL | os.O_RDWR
-                )
+                msvcrt.locking(self.fd, msvcrt.LK_NBLCK, 1)
             except OSError:
-                type, e, tb = sys.exc_info()
-                if e.errno == 13:
-                    logger.error(
-                        'Another instance is already running, quitting.'
-                    )
-                    raise SingleInstanceException()
-                print(e.errno)
-                raise
+                os.close(self.fd)
+                logger.error('Another instance is already running, quitting.')
+                raise SingleInstanceException()
         else:  # non Windows
             self.fp = open(self.lockfile, 'w')
             self.fp.flush()
             try:
-                fcntl.lockf(self.fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(self.fp, fcntl.LOCK_EX | fcntl.LOCK_NB)
             except IOError:
+                self.fp.close()
                 logger.error('Another instance is already running, quitting.')
                 raise SingleInstanceException()
         self.initialized = True
 
     def __del__(self):
+        self.release()
+
+    def release(self):
+        '''Release the lock and remove the lockfile.
+
+        Safe to call more than once, subsequent calls are no-ops.
+        '''
         logger.debug('Attempting to remove lockfile.')
         if not self.initialized:
             logger.debug('Singleton not initialized.')
             return
+        self.initialized = False
         try:
             if sys.platform == 'win32':
                 if hasattr(self, 'fd'):
+                    msvcrt.locking(self.fd, msvcrt.LK_UNLCK, 1)
                     os.close(self.fd)
                     os.unlink(self.lockfile)
             else:
-                fcntl.lockf(self.fp, fcntl.LOCK_UN)
+                fcntl.flock(self.fp, fcntl.LOCK_UN)
+                self.fp.close()
                 if os.path.isfile(self.lockfile):
                     os.unlink(self.lockfile)
 
@@ -1,6 +1,7 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2014-2023 ftrack
 import copy
+import functools
 import logging
 import os
 import platform
@@ -40,8 +41,6 @@ from ftrack_connect.application_launcher.discover_applications import (
     DiscoverApplications,
 )
 from ftrack_connect.ui import login_tools as _login_tools
-from ftrack_connect.ui.widget import about as _about
-from ftrack_connect.ui.widget import configure_scenario as _scenario_widget
 from ftrack_connect.ui.widget import login as _login
 from ftrack_connect.ui.widget import tab_widget as _tab_widget
 from ftrack_connect.ui.widget import uncaught_error as _uncaught_error
@@ -132,6 +131,31 @@ class ConnectWidget(QtWidgets.QWidget):
         }
 
 
+@functools.lru_cache(maxsize=None)
+def _get_theme_detection_module():
+    '''Return the darkdetect module for this platform, resolved once as the
+    platform cannot change while running.'''
+    # replicate content of https://github.com/albertosottile/darkdetect/blob/master/darkdetect/__init__.py
+    # as does not work when frozen
+    if sys.platform == "darwin":
+        from darkdetect import _mac_detect as stylemodule
+
+    elif (
+        sys.platform == "win32"
+        and platform.release().isdigit()  # Windows 8.1 would result in '8.1' str
+        and int(platform.release()) >= 10
+    ):
+        from darkdetect import _windows_detect as stylemodule
+
+    elif sys.platform == "linux":
+        from darkdetect import _linux_detect as stylemodule
+
+    else:
+        from darkdetect import _dummy as stylemodule
+
+    return stylemodule
+
+
 class Application(QtWidgets.QMainWindow):
     '''Main application window for ftrack connect.'''
 
@@ -172,7 +196,9 @@ class Application(QtWidgets.QMainWindow):
         self._discovered_plugins = (
             self._discover_plugin_data_from_plugin_directories()
         )
-        self._plugins = self._available_plugin_data_from_plugin_directories()
+        self._plugins = self._available_plugin_data_from_plugin_directories(
+            self._discovered_plugins
+        )
 
         # Register widget for error handling.
         self.uncaughtError = _uncaught_error.UncaughtError(
@@ -212,7 +238,7 @@ class Application(QtWidgets.QMainWindow):
         '''restart connect application'''
         self.logger.info('Connect restarting....')
         QtWidgets.QApplication.quit()
-        self._instance.__del__()
+        self._instance.release()
 
         # Give enough time to ensure the lockfile has been removed
         while os.path.exists(self._instance.lockfile):
@@ -258,25 +284,7 @@ class Application(QtWidgets.QMainWindow):
         return result_logo
 
     def system_theme(self, fallback='light'):
-        # replicate content of https://github.com/albertosottile/darkdetect/blob/master/darkdetect/__init__.py
-        # as does not work when frozen
-        if sys.platform == "darwin":
-            from darkdetect import _mac_detect as stylemodule
-
-        elif (
-            sys.platform == "win32"
-            and platform.release().isdigit()  # Windows 8.1 would result in '8.1' str
-            and int(platform.release()) >= 10
-        ):
-            from darkdetect import _windows_detect as stylemodule
-
-        elif sys.platform == "linux":
-            from darkdetect import _linux_detect as stylemodule
-
-        else:
-            from darkdetect import _dummy as stylemodule
-
-        current_theme = stylemodule.theme()
+        current_theme = _get_theme_detection_module().theme()
         if not current_theme:
             self.logger.warning(
                 'System theme could not be determined, using: light'
@@ -473,7 +481,7 @@ class Application(QtWidgets.QMainWindow):
                 continue
             if plugin['incompatible']:
                 self.logger.warning(
-                    f'Ignoring plugin that is incompatible: {plugin["path"]}'
+                    'Ignoring plugin that is incompatible: %s', plugin['path']
                 )
                 continue
             checked_plugins.append(plugin['name'])
@@ -613,6 +621,10 @@ class Application(QtWidgets.QMainWindow):
                 'storage_scenario'
             )
             if storage_scenario is None:
+                from ftrack_connect.ui.widget import (
+                    configure_scenario as _scenario_widget,
+                )
+
                 ftrack_api.plugin.discover(
                     self._get_api_plugin_paths(), [self.session]
                 )
@@ -712,12 +724,10 @@ class Application(QtWidgets.QMainWindow):
         result = []
         if not plugin_directory:
             return result
-        self.logger.debug(
-            u'Searching {0!r} for plugin hooks.'.format(plugin_directory)
-        )
+        self.logger.debug('Searching %r for plugin hooks.', plugin_directory)
         if os.path.isdir(plugin_directory):
             for candidate in get_plugins_from_path(plugin_directory):
-                self.logger.debug(f'Checking candidate {candidate}.')
+                self.logger.debug('Checking candidate %s.', candidate)
                 candidate_path = os.path.join(plugin_directory, candidate)
                 plugin_data = get_plugin_data(candidate_path)
                 if not plugin_data:
@@ -727,67 +737,64 @@ class Application(QtWidgets.QMainWindow):
                 result.append(plugin_data)
 
         self.logger.debug(
-            u'Found {0!r} plugin hooks in {1!r}.'.format(
-                result, plugin_directory
-            )
+            'Found %r plugin hooks in %r.', result, plugin_directory
         )
 
         return result
 
-    def _available_plugin_data_from_plugin_directories(self):
-        '''Return a list of plugin data'''
+    def _available_plugin_data_from_plugin_directories(
+        self, discovered_plugins=None
+    ):
+        '''Return a list of plugin data, picked from *discovered_plugins* or
+        from the plugin directories if not given.'''
+
+        if discovered_plugins is None:
+            discovered_plugins = (
+                self._discover_plugin_data_from_plugin_directories()
+            )
+        # Discovered plugins grouped by plugin directory, in discovery order.
+        plugins_by_source_index = {}
+        for plugin in discovered_plugins:
+            plugins_by_source_index.setdefault(
+                plugin['source_index'], []
+            ).append(plugin)
 
         result = []
-        i = 0
-        for plugin_base_directory in PLUGIN_DIRECTORIES:
-            current_dir_plugins = []
-            for plugin in self._gather_plugins(
-                plugin_base_directory, source_index=i
-            ):
-                # Append plugin if not already in more prioritized paths. - top plugin path takes preference
-                found = False
-                for existing_plugin in result:
-                    if (
-                        existing_plugin['name'].lower()
-                        == plugin['name'].lower()
-                    ):
-                        found = True
-                        break
+        # Lower case names of plugins already picked from previous paths.
+        result_names = set()
+        for i in range(len(PLUGIN_DIRECTORIES)):
+            # Plugins picked from the current folder, keyed by lower case name.
+            current_dir_plugins = {}
+            for plugin in plugins_by_source_index.get(i, []):
+                plugin_name = plugin['name'].lower()
+                # Skip plugin if already in more prioritized paths. - top plugin path takes preference
+                if plugin_name in result_names:
+                    continue
                 # Make sure we pick the compatible latest version of the plugin from the current folder
-                for current_dir_plugin in current_dir_plugins:
-                    if (
-                        current_dir_plugin['name'].lower()
-                        == plugin['name'].lower()
-                    ):
-                        if (
-                            current_dir_plugin['incompatible']
-                            and not plugin['incompatible']
-                        ):
-                            current_dir_plugins.remove(current_dir_plugin)
-                            break
-                        elif (
+                current_dir_plugin = current_dir_plugins.get(plugin_name)
+                if current_dir_plugin is not None:
+                    replace = (
+                        current_dir_plugin['incompatible']
+                        and not plugin['incompatible']
+                    ) or (
+                        not plugin['incompatible']
+                        and not plugin['deprecated']
+                        and (
                             current_dir_plugin['deprecated']
-                            and not plugin['incompatible']
-                            and not plugin['deprecated']
-                        ):
-                            current_dir_plugins.remove(current_dir_plugin)
-                            break
-                        elif (
-                            not plugin['incompatible']
-                            and not plugin['deprecated']
-                        ):
-                            if (
-                                current_dir_plugin['version']
-                                < plugin['version']
-                            ):
-                                current_dir_plugins.remove(current_dir_plugin)
-                                break
-                        found = True
-                        break
-                if not found:
-                    current_dir_plugins.append(plugin)
-            result.extend(current_dir_plugins)
-            i += 1
+                            or current_dir_plugin['version']
+                            < plugin['version']
+                        )
+                    )
+                    if not replace:
+                        continue
+                    # Remove it so that the picked plugin is appended last.
+                    del current_dir_plugins[plugin_name]
+                current_dir_plugins[plugin_name] = plugin
+            # Copy so that the discovered plugin data is left untouched.
+            result.extend(
+                dict(plugin) for plugin in current_dir_plugins.values()
+            )
+            result_names.update(current_dir_plugins)
         return result
 
     def _discover_plugin_data_from_plugin_directories(self):
@@ -990,7 +997,9 @@ class Application(QtWidgets.QMainWindow):
 
         plugin.refresh()
 
-        self.logger.debug(f'Plugin {name}({plugin.__class__.__name__}) added')
+        self.logger.debug(
+            'Plugin %s(%s) added', name, plugin.__class__.__name__
+        )
 
     def _remove_plugin(self, plugin):
         '''Remove plugin registered with *identifier*.
@@ -1030,8 +1039,7 @@ class Application(QtWidgets.QMainWindow):
 
     def _show_about(self):
         '''Display window with about information.'''
-        from ftrack_connect.plugin_manager import PluginManager
-        from ftrack_connect.plugin_manager.processor import ROLES, STATUSES
+        from ftrack_connect.ui.widget import about as _about
 
         self.focus()
 
@@ -1155,8 +1163,8 @@ class Application(QtWidgets.QMainWindow):
         launcher_config_paths = []
 
         self.logger.debug(
-            f'Discovering applications launcher configs based on'
-            f' {len(self.plugins)} plugins.'
+            'Discovering applications launcher configs based on %s plugins.',
+            len(self.plugins),
         )
 
         for connect_plugin_path in [plugin['path'] for plugin in self.plugins]:
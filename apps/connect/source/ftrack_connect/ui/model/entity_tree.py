@@ -426,8 +426,10 @@ class EntityTreeModel(QtCore.QAbstractItemModel):
             )
             self._worker.start()
 
-            while self._worker.isRunning():
-                app = QtWidgets.QApplication.instance()
+            # Keep the UI responsive while waiting, without spinning on
+            # processEvents.
+            app = QtWidgets.QApplication.instance()
+            while not self._worker.wait(20):
                 app.processEvents()
 
             if self._worker.error:
@@ -7,6 +7,10 @@ except ImportError:
     from PySide2 import QtWidgets, QtCore, QtGui
 
 
+# Stylesheet content by theme name, see _getStyleSheet.
+_styleSheets = {}
+
+
 def applyFont():
     '''Add application font.'''
     fonts = [':/ftrack/font/regular', ':/ftrack/font/medium']
@@ -20,12 +24,19 @@ def applyTheme(widget, theme='light', baseTheme=None):
     if baseTheme and QtWidgets.QApplication.style().objectName() != baseTheme:
         QtWidgets.QApplication.setStyle(baseTheme)
 
-    # Load stylesheet from resource file and apply.
-    fileObject = QtCore.QFile(':/ftrack/style/{0}'.format(theme))
-    fileObject.open(
-        QtCore.QFile.OpenModeFlag.ReadOnly | QtCore.QFile.OpenModeFlag.Text
-    )
-    stream = QtCore.QTextStream(fileObject)
-    styleSheetContent = stream.readAll()
+    widget.setStyleSheet(_getStyleSheet(theme))
+
+
+def _getStyleSheet(theme):
+    '''Return stylesheet content for *theme*, read from the resource file
+    once.'''
+    if theme not in _styleSheets:
+        fileObject = QtCore.QFile(':/ftrack/style/{0}'.format(theme))
+        fileObject.open(
+            QtCore.QFile.OpenModeFlag.ReadOnly | QtCore.QFile.OpenModeFlag.Text
+        )
+        stream = QtCore.QTextStream(fileObject)
+        _styleSheets[theme] = stream.readAll()
+        fileObject.close()
 
-    widget.setStyleSheet(styleSheetContent)
+    return _styleSheets[theme]
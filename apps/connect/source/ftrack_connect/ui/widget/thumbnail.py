@@ -41,8 +41,11 @@ class Base(QtWidgets.QLabel):
             return
 
         if self._worker and self._worker.isRunning():
+            # Wait for the previous load to be handled, processing events at
+            # most every 20 ms rather than spinning on processEvents.
+            app = QtWidgets.QApplication.instance()
             while self._worker:
-                app = QtWidgets.QApplication.instance()
+                self._worker.wait(20)
                 app.processEvents()
 
         self._worker = ftrack_connect.worker.Worker(
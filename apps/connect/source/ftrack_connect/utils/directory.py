@@ -28,12 +28,10 @@ def open_directory(path):
         directory = path
 
     if sys.platform == 'win32':
-        # In order to support directories with spaces, the start command
-        # requires two quoted args, the first is the shell title, and
-        # the second is the directory to open in. Using string formatting
-        # here avoids the auto-escaping that python introduces, which
-        # seems to fail...
-        subprocess.Popen('start "" "{0}"'.format(directory), shell=True)
+        # Open through the shell association directly rather than spawning
+        # cmd.exe to run start, which also avoids quoting directories with
+        # spaces.
+        os.startfile(directory)
 
     elif sys.platform == 'darwin':
         if os.path.isfile(path):
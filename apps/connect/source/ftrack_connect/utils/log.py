@@ -4,32 +4,31 @@ import os
 import logging
 import logging.config
 import platformdirs
-import errno
 
 
 def get_default_log_directory():
     return platformdirs.user_data_dir('ftrack-connect', 'ftrack', 'log')
 
 
+# Log directory once it has been resolved.
+_log_directory = None
+
+
 def get_log_directory():
     '''Get log directory.
 
-    Will create the directory (recursively) if it does not exist.
+    Will create the directory (recursively) if it does not exist, the
+    resolved path is cached for subsequent calls.
 
     Raise if the directory can not be created.
     '''
-    log_directory = get_default_log_directory()
+    global _log_directory
+    if _log_directory is None:
+        _log_directory = get_default_log_directory()
 
-    if not os.path.exists(log_directory):
-        try:
-            os.makedirs(log_directory)
-        except OSError as error:
-            if error.errno == errno.EEXIST and os.path.isdir(log_directory):
-                pass
-            else:
-                raise
-
-    return log_directory
+    # Checked on every call as the directory might have been removed since.
+    os.makedirs(_log_directory, exist_ok=True)
+    return _log_directory
 
 
 def configure_logging(
@@ -43,6 +42,9 @@ def configure_logging(
     `%(asctime)s - %(name)s - %(levelname)s - %(message)s`.
 
     Optional *extra_modules* to extend the modules to be set to *level*.
+
+    Safe to call again to reconfigure, handlers are replaced rather than
+    added by :func:`logging.config.dictConfig`.
     '''
 
     # Provide default values for level and format.
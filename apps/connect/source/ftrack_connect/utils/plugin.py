@@ -2,11 +2,12 @@
 # :copyright: Copyright (c) 2014-2023 ftrack
 
 import os
+import functools
 import logging
 import re
 import sys
-import requests
 import glob
+import threading
 
 import platformdirs
 from packaging.version import parse
@@ -20,6 +21,19 @@ from ftrack_connect import (
 
 logger = logging.getLogger(__name__)
 
+# Per thread requests sessions, see _get_requests_session.
+_requests_sessions = threading.local()
+
+
+@functools.lru_cache(maxsize=512)
+def parse_version(version):
+    '''Return parsed *version*.
+
+    Plugin versions are compared repeatedly across the installed and released
+    plugins, the parsed versions are immutable and can safely be shared.
+    '''
+    return parse(version)
+
 
 def get_default_plugin_directory():
     return platformdirs.user_data_dir('ftrack-connect-plugins', 'ftrack')
@@ -32,6 +46,15 @@ PLUGIN_DIRECTORIES = [
     ).split(os.pathsep)
 ]
 
+# Plugin folder or archive names, see get_plugin_data.
+PLUGIN_NAME_RE = re.compile(
+    r'(?P<name>.+?)-(?P<version>\d+\.\d+(?:\.\d+)?(?:[a-zA-Z]+\d+)?)(?:-(?P<platform>\w+))?(?P<extension>(?:\.\w+)+)?$'
+)
+DEPRECATED_PLUGIN_NAME_RE = re.compile(r'^(?P<name>[a-zA-Z0-9_\-]+)$')
+
+# Release tag versions, with or without patch, capturing the major version.
+RELEASE_VERSION_RE = re.compile(r'v(\d+)\.\d+\.*')
+
 
 def get_plugins_from_path(plugin_directory):
     '''Return folders from the given *connect_plugin_path* directory'''
@@ -66,37 +89,37 @@ def get_plugin_data(plugin_path):
     "my_plugin"
     "my-plugin"
     '''
-    plugin_re = re.compile(
-        r'(?P<name>.+?)-(?P<version>\d+\.\d+(?:\.\d+)?(?:[a-zA-Z]+\d+)?)(?:-(?P<platform>\w+))?(?P<extension>(?:\.\w+)+)?$'
-    )
-
     plugin_name = os.path.basename(plugin_path)
-    match = plugin_re.match(plugin_name)
+    match = PLUGIN_NAME_RE.match(plugin_name)
     if match:
         data = match.groupdict()
     else:
         # Check if it's a legacy action or custom plugin
-        deprecated_plugin_re = re.compile(r'^(?P<name>[a-zA-Z0-9_\-]+)$')
-        deprecated_match = deprecated_plugin_re.match(plugin_name)
+        deprecated_match = DEPRECATED_PLUGIN_NAME_RE.match(plugin_name)
 
         suggested_valid_name = suggest_valid_name(plugin_name)
 
         if not deprecated_match:
             logger.warning(
-                f"The provided plugin path can't be recognized: {plugin_path}. "
-                f"Please make sure that plugin name matches the following format: "
-                f"my-plugin-1.0.0. "
-                f"\n Current plugin name: {plugin_name}, "
-                f"suggested plugin name:{suggested_valid_name}"
+                "The provided plugin path can't be recognized: %s. "
+                "Please make sure that plugin name matches the following format: "
+                "my-plugin-1.0.0. "
+                "\n Current plugin name: %s, "
+                "suggested plugin name:%s",
+                plugin_path,
+                plugin_name,
+                suggested_valid_name,
             )
             return False
         logger.warning(
-            f"The provided plugin name would be deprecated soon, please use "
-            f"dash instead of underscore and version the plugin for further "
-            f"compatibility. "
-            f"Example of a valid plugin name: my-custom-plugin-1.0.0. \n "
-            f"Current name: {plugin_name}, "
-            f"suggested plugin name:{suggested_valid_name}"
+            "The provided plugin name would be deprecated soon, please use "
+            "dash instead of underscore and version the plugin for further "
+            "compatibility. "
+            "Example of a valid plugin name: my-custom-plugin-1.0.0. \n "
+            "Current name: %s, "
+            "suggested plugin name:%s",
+            plugin_name,
+            suggested_valid_name,
         )
         data = deprecated_match.groupdict()
         data['version'] = "0.0.0"
@@ -107,7 +130,8 @@ def get_plugin_data(plugin_path):
     if data.get('extension'):
         if data['extension'] != '.zip':
             logger.warning(
-                f"Sorry, we only support .zip extensions for now, ignoring plugin: {plugin_path}"
+                "Sorry, we only support .zip extensions for now, ignoring plugin: %s",
+                plugin_path,
             )
             return False
     data['incompatible'] = is_incompatible_plugin(data)
@@ -138,7 +162,7 @@ def is_incompatible_plugin(plugin_data):
     and cannot be loaded'''
     for incompatible_plugin in INCOMPATIBLE_PLUGINS:
         if plugin_data['name'].lower() == incompatible_plugin['name']:
-            parsed_plugin_version = parse(plugin_data['version'])
+            parsed_plugin_version = parse_version(plugin_data['version'])
 
             # Create the specifier compatible with pre-releases
             incompatible_specifier = SpecifierSet(
@@ -147,12 +171,13 @@ def is_incompatible_plugin(plugin_data):
 
             if parsed_plugin_version not in incompatible_specifier:
                 logger.debug(
-                    f"Version {plugin_data['version']} is compatible."
+                    'Version %s is compatible.', plugin_data['version']
                 )
                 break
             logger.debug(
-                f"{plugin_data['name']} version {plugin_data['version']} is "
-                f"incompatible"
+                '%s version %s is incompatible',
+                plugin_data['name'],
+                plugin_data['version'],
             )
             return True
     # Don't check anything else if path is zip file.
@@ -164,8 +189,10 @@ def is_incompatible_plugin(plugin_data):
         f'{connect_hook}/*.py'
     ):
         logger.debug(
-            f"{plugin_data['name']} version {plugin_data['version']} is "
-            f"incompatible, hook folder or hook python file is missing"
+            '%s version %s is incompatible, hook folder or hook python file '
+            'is missing',
+            plugin_data['name'],
+            plugin_data['version'],
         )
         return True
 
@@ -177,7 +204,7 @@ def is_deprecated_plugin(plugin_data):
     but still can be loaded'''
     for deprecated_plugin in DEPRECATED_PLUGINS:
         if plugin_data['name'].lower() == deprecated_plugin['name']:
-            parsed_plugin_version = parse(plugin_data['version'])
+            parsed_plugin_version = parse_version(plugin_data['version'])
 
             # Create the specifier compatible with pre-releases
             deprecated_specifier = SpecifierSet(
@@ -186,12 +213,13 @@ def is_deprecated_plugin(plugin_data):
 
             if parsed_plugin_version not in deprecated_specifier:
                 logger.debug(
-                    f"Version {plugin_data['version']} is compatible."
+                    'Version %s is compatible.', plugin_data['version']
                 )
                 return False
             logger.debug(
-                f"{plugin_data['name']} version {plugin_data['version']} is "
-                f"deprecated"
+                '%s version %s is deprecated',
+                plugin_data['name'],
+                plugin_data['version'],
             )
             return True
     return False
@@ -203,19 +231,29 @@ def get_plugin_json_url_from_environment():
 
 
 def check_major_version(version, major_version_start=24):
-    match = re.match(r'v(\d+)\.\d+\.\d+.*', version)
-    no_path_match = re.match(r'v(\d+)\.\d+\.*', version)
+    # Matches versions with or without patch.
+    match = RELEASE_VERSION_RE.match(version)
     if match:
         major_version = int(match.group(1))
         return major_version >= major_version_start
-    elif no_path_match:
-        # Without patch
-        major_version = int(no_path_match.group(1))
-        return major_version >= major_version_start
     else:
         return False
 
 
+def _get_requests_session():
+    '''Return the requests session of the current thread, so that
+    connections are kept alive between plugin manager refreshes. Sessions
+    are not thread safe and releases are fetched from several threads.'''
+    session = getattr(_requests_sessions, 'session', None)
+    if session is None:
+        # Imported here as requests is slow to import and only needed once
+        # the plugin manager fetches releases.
+        import requests
+
+        session = _requests_sessions.session = requests.Session()
+    return session
+
+
 def fetch_github_releases(url, latest=True, prereleases=False):
     '''Read github releases and return a list of releases, and
     list of assets as value. If *latest* is True, only the latest
@@ -223,12 +261,12 @@ def fetch_github_releases(url, latest=True, prereleases=False):
     prereleases are included in the result.'''
 
     logger.debug(
-        f'Fetching releases from: {url} (pre-releases: {prereleases})'
+        'Fetching releases from: %s (pre-releases: %s)', url, prereleases
     )
 
-    response = requests.get(f"{url}/releases")
+    response = _get_requests_session().get(f"{url}/releases")
     if response.status_code != 200:
-        logger.error(f'Failed to fetch releases from {url}')
+        logger.error('Failed to fetch releases from %s', url)
         return []
 
     data = {}
@@ -239,10 +277,10 @@ def fetch_github_releases(url, latest=True, prereleases=False):
         if not tag_name:
             continue
         if release.get('draft') is True:
-            logger.debug(f'   Skipping draft release: {tag_name}')
+            logger.debug('   Skipping draft release: %s', tag_name)
             continue
 
-        logger.debug(f'Found release: {tag_name}')
+        logger.debug('Found release: %s', tag_name)
 
         # Check if it is a Connect release
         package = tag_name.split('/')[0]
@@ -251,16 +289,18 @@ def fetch_github_releases(url, latest=True, prereleases=False):
             # TODO: solve the issue when library major version is catching up to
             #  Connect major version
             logger.debug(
-                f'   Not a Connect release on YY.m.p|YY.mp format: {tag_name} \n '
-                f'Minimum compatible major version is 24.X.X'
+                '   Not a Connect release on YY.m.p|YY.mp format: %s \n '
+                'Minimum compatible major version is 24.X.X',
+                tag_name,
             )
             continue
 
-        if not prereleases and release.get('prerelease') is True:
-            logger.debug(f'   Skipping pre-release: {tag_name}')
+        is_prerelease = release.get('prerelease')
+        if not prereleases and is_prerelease is True:
+            logger.debug('   Skipping pre-release: %s', tag_name)
             continue
-        elif prereleases and not release.get('prerelease'):
-            logger.debug(f'   Skipping release: {tag_name}')
+        elif prereleases and not is_prerelease:
+            logger.debug('   Skipping release: %s', tag_name)
             continue
         release_data = {
             'id': release['id'],
@@ -268,24 +308,24 @@ def fetch_github_releases(url, latest=True, prereleases=False):
             'tag': tag_name,
             'package': package,
             'version': version,
-            'prerelease': release.get("prerelease"),
+            'prerelease': is_prerelease,
             'body': release["body"] or "",
             'assets': [],
         }
         assets = release.get('assets', [])
         url = None
         for asset in assets:
-            logger.debug(
-                f"   Found asset: {asset['name']}, {asset['browser_download_url']}"
-            )
+            asset_name = asset['name']
+            asset_url = asset['browser_download_url']
+            logger.debug('   Found asset: %s, %s', asset_name, asset_url)
 
             release_data['assets'].append(
-                {'name': asset['name'], 'url': asset['browser_download_url']}
+                {'name': asset_name, 'url': asset_url}
             )
 
             # Evaluate if we can use this asset
 
-            base, ext = os.path.splitext(asset['name'])
+            base, ext = os.path.splitext(asset_name)
 
             if ext.lower() != '.zip':
                 continue
@@ -299,19 +339,17 @@ def fetch_github_releases(url, latest=True, prereleases=False):
                     # Not our platform
                     continue
 
-            logger.debug(
-                f"   Supplying asset: {asset['name']}, {asset['browser_download_url']}"
-            )
-            url = asset['browser_download_url']
+            logger.debug('   Supplying asset: %s, %s', asset_name, asset_url)
+            url = asset_url
 
         if url:
-            logger.debug(f'Supplying release: {tag_name}')
+            logger.debug('Supplying release: %s', tag_name)
             release_data['url'] = url
             if not latest or package not in data:
                 data[package] = release_data
             else:
                 current_version = data[package]['tag'].rsplit('/', 1)[1][1:]
-                if parse(current_version) < parse(version):
+                if parse_version(current_version) < parse_version(version):
                     # This version is higher
                     data[package] = release_data
 
@@ -322,6 +360,7 @@ def fetch_github_releases(url, latest=True, prereleases=False):
     return result
 
 
+@functools.lru_cache(maxsize=None)
 def get_platform_identifier():
     '''Return platform identifier for current platform, used in plugin package
     filenames'''
@@ -337,10 +376,12 @@ def get_platform_identifier():
 
 
 def create_target_plugin_directory(directory):
+    # A single stat on the common path where the directory already exists.
     if not os.path.exists(directory):
-        # Create directory if not existing.
+        # Create directory if not existing, tolerating a concurrent creation
+        # from another Connect instance.
         try:
-            os.makedirs(directory)
+            os.makedirs(directory, exist_ok=True)
         except Exception as e:
             raise Exception(
                 f"Couldn't create the target plugin directory: {e}"
@@ -1,28 +1,121 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2025 Mana
 
+import functools
+import itertools
 import json
 import os
 import re
+import string
 import unicodedata
 import uuid
 from builtins import str
 
+import ftrack_api.collection
+import ftrack_api.entity.base
 import ftrack_api.structure.base
 import ftrack_api.symbol
 
+# Ascii characters valid for filesystem usage.
+_LEGAL_CHARACTERS = frozenset(string.ascii_letters + string.digits + "_.-")
+# Sequence expressions like .%04d.png, _%04d.png or %04d.png.
+_SEQUENCE_EXPRESSION_RE = re.compile(r"(\.|_)?%0\d+d\.[a-zA-Z0-9]+$")
 
-def get_resolution_id(resolution):
-
-    # Define the path to the resolutions.json file
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    resolutions_file = os.path.abspath(
-        os.path.join(base_dir, "..", "config.json")
+# Plugin configuration holding the resolution ids.
+_CONFIG_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "config.json"
+    )
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_resolutions():
+    """Return the parsed config.json, read once as it is looked up for every
+    delivery component."""
+    with open(_CONFIG_PATH, "r") as file:
+        return json.load(file)
+
+
+@functools.lru_cache(maxsize=256)
+def _convert_to_pascal_case(value):
+    """Return snake_case *value* in PascalCase, cached as the same project
+    name is converted for every delivery component."""
+    return "".join(word.title() for word in value.split("_"))
+
+
+# Version attributes used to build the path of every component, and the
+# extra ones used for delivery versions.
+_VERSION_PROJECTIONS = (
+    "link",
+    "version",
+    "asset.type.name",
+    "task.name",
+    "task.type.name",
+    "task.parent.name",
+)
+_DELIVERY_VERSION_PROJECTIONS = (
+    "user.first_name",
+    "user.last_name",
+    "task.assignments.resource",
+    "task.parent.custom_attributes",
+)
+
+
+def _is_loaded(entity, projection):
+    """Return whether dotted *projection* is loaded on *entity*, without
+    fetching anything from the server.
+
+    For a collection, the rest of *projection* has to be loaded on every
+    member.
+    """
+    name, _, remaining = projection.partition(".")
+    attribute = entity.attributes.get(name)
+    if attribute is None:
+        return True
+    if not attribute.is_set(entity):
+        return False
+    if not remaining:
+        return True
+    value = attribute.get_value(entity)
+    if isinstance(value, ftrack_api.entity.base.Entity):
+        return _is_loaded(value, remaining)
+    if isinstance(value, ftrack_api.collection.Collection):
+        return all(_is_loaded(member, remaining) for member in value)
+    # Unset relation, nothing further to load here.
+    return True
+
+
+def _populate_missing(entity, projections):
+    """Fetch the *projections* of *entity* not loaded yet in one query.
+
+    populate always queries the server, so only ask for what is missing, the
+    members of a sequence resolve the same version over and over.
+    """
+    missing = [
+        projection
+        for projection in projections
+        if not _is_loaded(entity, projection)
+    ]
+    if missing:
+        entity.session.populate(entity, ", ".join(missing))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_illegal_character_table(substitute):
+    """Return a translation table replacing illegal ascii characters with
+    *substitute*."""
+    return str.maketrans(
+        {
+            character: substitute
+            for character in map(chr, range(128))
+            if character not in _LEGAL_CHARACTERS
+        }
     )
 
-    # Load mount points from JSON file
-    with open(resolutions_file, "r") as file:
-        resolutions = json.load(file)
+
+def get_resolution_id(resolution):
+    resolutions = _load_resolutions()
 
     if resolution not in resolutions["resolution_id"]:
         return uuid.uuid4().int % 957 + len(
@@ -57,12 +150,19 @@ class ManaStructure(ftrack_api.structure.base.Structure):
         if version is ftrack_api.symbol.NOT_SET or version in session.created:
             raise ftrack_api.exception.StructureError(error_message)
 
+        # Fetch the attributes used below that are not loaded yet in one
+        # query rather than loading them one at a time.
+        _populate_missing(version, _VERSION_PROJECTIONS)
+
         link = version["link"]
 
         if not link:
             raise ftrack_api.exception.StructureError(error_message)
 
-        structure_names = [item["name"] for item in link[1:-1]]
+        # Skip the project and the version itself without copying the link.
+        structure_names = [
+            item["name"] for item in itertools.islice(link, 1, len(link) - 1)
+        ]
 
         project_id = link[0]["id"]
         project = session.get("Project", project_id)
@@ -87,7 +187,7 @@ class ManaStructure(ftrack_api.structure.base.Structure):
             parts.append(asset["type"]["name"])
         parts.append(version_number)
 
-        parts = [self.sanitise_for_filesystem(part) for part in parts]
+        parts = tuple(self.sanitise_for_filesystem(part) for part in parts)
 
         ### Build base name
         name_parts = []
@@ -100,6 +200,7 @@ class ManaStructure(ftrack_api.structure.base.Structure):
         name_parts.append(version_number)
 
         if version_type == "Delivery":
+            _populate_missing(version, _DELIVERY_VERSION_PROJECTIONS)
 
             name_parts = []
             version_custom_attributes = version["task"]["parent"][
@@ -174,7 +275,7 @@ class ManaStructure(ftrack_api.structure.base.Structure):
         # Extract the file name from the path
         filename = os.path.basename(filepath)
         # Remove patterns like .%0Xd.png, _%0Xd.png, or %0Xd.png (any padding value)
-        cleaned_name = re.sub(r"(\.|_)?%0\d+d\.[a-zA-Z0-9]+$", "", filename)
+        cleaned_name = _SEQUENCE_EXPRESSION_RE.sub("", filename)
         return cleaned_name
 
     def sanitise_for_filesystem(self, value):
@@ -191,17 +292,24 @@ class ManaStructure(ftrack_api.structure.base.Structure):
         if self.illegal_character_substitute is None:
             return value
 
-        value = unicodedata.normalize("NFKD", str(value)).encode(
-            "ascii", "ignore"
-        )
-        value = re.sub(
-            "[^\w\.-]", self.illegal_character_substitute, value.decode("utf-8")
+        value = str(value)
+        # Ascii values, the common case, are left unchanged by normalization.
+        if not value.isascii():
+            value = (
+                unicodedata.normalize("NFKD", value)
+                .encode("ascii", "ignore")
+                .decode("utf-8")
+            )
+        # The value is ascii at this point, so a translation table covers
+        # every illegal character.
+        value = value.translate(
+            _get_illegal_character_table(self.illegal_character_substitute)
         )
         return str(value.strip())
 
     def convert_to_pascal_case(self, value):
         """Convert snake_case string to PascalCase format."""
-        return "".join(word.title() for word in value.split("_"))
+        return _convert_to_pascal_case(value)
 
     def get_resource_identifier(self, entity, context=None):
         """Return a resource identifier for supplied *entity*.
@@ -248,33 +356,33 @@ class ManaStructure(ftrack_api.structure.base.Structure):
                     parts = [container_path, self.sanitise_for_filesystem(name)]
 
             else:
-                parts = self._get_parts(entity).get("parts")
-                name = (
-                    self._get_parts(entity).get("base_name")
-                    + entity["file_type"]
+                entity_parts = self._get_parts(entity)
+                name = entity_parts.get("base_name") + entity["file_type"]
+                parts = (
+                    *entity_parts.get("parts"),
+                    self.sanitise_for_filesystem(name),
                 )
-                parts.append(self.sanitise_for_filesystem(name))
 
         elif entity.entity_type in ("SequenceComponent",):
             # Create sequence expression for the sequence component and add it
             # to the parts.
-            parts = self._get_parts(entity).get("parts")
+            entity_parts = self._get_parts(entity)
             sequence_expression = self._get_sequence_expression(entity)
-            parts.append(
+            parts = (
+                *entity_parts.get("parts"),
                 "{0}.{1}{2}".format(
-                    self._get_parts(entity).get("base_name"),
+                    entity_parts.get("base_name"),
                     sequence_expression,
                     entity["file_type"],
-                )
+                ),
             )
 
         elif entity.entity_type in ("ContainerComponent",):
             # Add the name of the container to the resource identifier parts.
-            parts = self._get_parts(entity).get("parts")
-            parts.append(
-                self.sanitise_for_filesystem(
-                    self._get_parts(entity).get("base_name")
-                )
+            entity_parts = self._get_parts(entity)
+            parts = (
+                *entity_parts.get("parts"),
+                self.sanitise_for_filesystem(entity_parts.get("base_name")),
             )
 
         else:
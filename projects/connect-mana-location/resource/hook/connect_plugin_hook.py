@@ -18,9 +18,12 @@ logger = logging.getLogger("com.ftrack.recipes.customise_structure.hook")
 
 
 def append_path(path, key, environment):
-    """Append *path* to *key* in *environment*."""
+    """Append *path* to *key* in *environment*, unless already present."""
     try:
-        environment[key] = os.pathsep.join([environment[key], path])
+        # Events can be handled more than once for the same environment, do
+        # not let the value grow with duplicates.
+        if path not in environment[key].split(os.pathsep):
+            environment[key] = os.pathsep.join([environment[key], path])
     except KeyError:
         environment[key] = path
 
@@ -30,32 +33,13 @@ def append_path(path, key, environment):
 def modify_application_launch(event):
     """Modify the application environment to include our location plugin."""
     try:
-        # Check if this is an application launch (has options.env structure)
-        if "options" in event["data"] and isinstance(
-            event["data"]["options"], dict
-        ):
-            # Application launched from ftrack connect
-            logger.debug("Application launch event detected")
-
-            # Get or create env dictionary
-            if "env" not in event["data"]["options"]:
-                event["data"]["options"]["env"] = {}
-
-            environment = event["data"]["options"]["env"]
-        else:
-            # API or publisher scenario - create options.env structure
-            logger.debug("API/publisher event detected")
-
-            if "data" not in event:
-                event["data"] = {}
-
-            if "options" not in event["data"]:
-                event["data"]["options"] = {}
-
-            if "env" not in event["data"]["options"]:
-                event["data"]["options"]["env"] = {}
-
-            environment = event["data"]["options"]["env"]
+        # Application launches from ftrack connect already carry options,
+        # API or publisher events may not, get or create the env dictionary.
+        environment = (
+            event.setdefault("data", {})
+            .setdefault("options", {})
+            .setdefault("env", {})
+        )
 
         # Now we have a valid environment dictionary, add our paths
         append_path(LOCATION_DIRECTORY, "FTRACK_EVENT_PLUGIN_PATH", environment)
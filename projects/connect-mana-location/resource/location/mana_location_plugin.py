@@ -1,6 +1,7 @@
 # :coding: utf-8
 # :copyright: Copyright (c) 2024 Mana
 
+import functools
 import json
 import os
 import platform
@@ -15,17 +16,21 @@ from structure import ManaStructure
 # Define the location name
 location_name = "mana.studio"
 
+# Plugin configuration holding the mount points.
+_CONFIG_PATH = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "config.json"
+    )
+)
 
-def get_prefix(location_name):
 
-    # Define the path to the mount_points.json file
-    base_dir = os.path.dirname(os.path.abspath(__file__))
-    mount_points_file = os.path.abspath(
-        os.path.join(base_dir, "..", "config.json")
-    )
+@functools.lru_cache(maxsize=None)
+def get_prefix(location_name):
+    """Return the mount point of *location_name* for the current OS, read
+    once as neither changes while the plugin is loaded."""
 
     # Load mount points from JSON file
-    with open(mount_points_file, "r") as file:
+    with open(_CONFIG_PATH, "r") as file:
         mount_points = json.load(file)
 
     # Determine the current OS type
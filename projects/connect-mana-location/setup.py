@@ -5,6 +5,7 @@
 import os
 import re
 import shutil
+import zipfile
 
 from setuptools import Command, find_packages, setup
 
@@ -15,18 +16,19 @@ README_PATH = os.path.join(ROOT_PATH, "README.md")
 RESOURCE_PATH = os.path.join(ROOT_PATH, "resource")
 
 
-# Read version from source.
+# Read version from source, stopping at the line that defines it.
 with open(
     os.path.join(SOURCE_PATH, "ftrack_connect_mana_location", "_version.py"),
 ) as _version_file:
-    VERSION = re.search(
-        r"__version__\s*=\s*['\"](.*?)['\"]", _version_file.read()
-    ).group(1)
-
-
-STAGING_PATH = os.path.join(
-    BUILD_PATH, "ftrack-connect-mana-location-{0}".format(VERSION)
-)
+    for _line in _version_file:
+        _match = re.search(r"__version__\s*=\s*['\"](.*?)['\"]", _line)
+        if _match:
+            VERSION = _match.group(1)
+            break
+    else:
+        raise RuntimeError(
+            "Unable to find __version__ in {0}.".format(_version_file.name)
+        )
 
 
 class BuildPlugin(Command):
@@ -44,29 +46,28 @@ class BuildPlugin(Command):
 
     def run(self):
         """Run the build step."""
-        # Clean staging path
-        shutil.rmtree(STAGING_PATH, ignore_errors=True)
-
-        shutil.copytree(
-            RESOURCE_PATH,
-            STAGING_PATH,
-            ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
-        )
-
-        result_path = shutil.make_archive(
-            os.path.join(
-                BUILD_PATH, "ftrack-connect-mana-location-{0}".format(VERSION)
-            ),
-            "zip",
-            STAGING_PATH,
-        )
+        os.makedirs(BUILD_PATH, exist_ok=True)
 
-        shutil.rmtree(
-            os.path.join(
-                BUILD_PATH, "ftrack-connect-mana-location-{0}".format(VERSION)
-            ),
-            ignore_errors=True,
+        result_path = os.path.join(
+            BUILD_PATH, "ftrack-connect-mana-location-{0}.zip".format(VERSION)
         )
+        ignore = shutil.ignore_patterns("__pycache__", "*.pyc")
+
+        # Zip the resources directly rather than copying them to a staging
+        # directory first.
+        with zipfile.ZipFile(
+            result_path, "w", zipfile.ZIP_DEFLATED
+        ) as archive:
+            for root, directories, files in os.walk(RESOURCE_PATH):
+                ignored = ignore(root, directories + files)
+                directories[:] = sorted(
+                    name for name in directories if name not in ignored
+                )
+                for name in directories + files:
+                    if name in ignored:
+                        continue
+                    path = os.path.join(root, name)
+                    archive.write(path, os.path.relpath(path, RESOURCE_PATH))
 
 
 # Call main setup.